@@ -0,0 +1,75 @@
+"""
+Build the local Bible database
+
+Downloads public-domain translations from bible-api.com's /data endpoints into
+a SQLite file that server.py serves verse and chapter lookups from, falling
+back to bible-api.com only for translations that aren't bundled.
+
+Usage: python build_bible_db.py [path] (default: bible.db)
+
+bible-api.com rate-limits clients, so requests are spaced out and a full
+build of both translations takes a while.
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import time
+import urllib.error
+import urllib.request
+
+TRANSLATIONS = ('kjv', 'web')
+
+# bible-api.com allows 15 requests every 30 seconds
+REQUEST_INTERVAL = 2.1
+
+def fetch(path: str) -> dict:
+    """GET a bible-api.com /data endpoint, waiting out rate limiting"""
+    url = f'https://bible-api.com/data/{path}'
+    while True:
+        time.sleep(REQUEST_INTERVAL)
+        try:
+            with urllib.request.urlopen(url, timeout=30) as response:
+                return json.load(response)
+        except urllib.error.HTTPError as e:
+            if e.code != 429:
+                raise
+            time.sleep(30)
+
+def build(path: str) -> None:
+    """Download every chapter of each bundled translation into a fresh database"""
+    tmp_path = path + '.tmp'
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    conn = sqlite3.connect(tmp_path)
+    conn.executescript("""
+        CREATE TABLE translations (id TEXT PRIMARY KEY, name TEXT NOT NULL);
+        CREATE TABLE bible (
+            translation TEXT NOT NULL,
+            book TEXT NOT NULL,
+            chapter INTEGER NOT NULL,
+            verse INTEGER NOT NULL,
+            text TEXT NOT NULL,
+            PRIMARY KEY (translation, book, chapter, verse)
+        ) WITHOUT ROWID;
+    """)
+    for translation in TRANSLATIONS:
+        index = fetch(translation)
+        conn.execute("INSERT INTO translations VALUES (?, ?)", (translation, index['translation']['name']))
+        for book in index['books']:
+            chapters = fetch(f"{translation}/{book['id']}")['chapters']
+            for chapter in chapters:
+                verses = fetch(f"{translation}/{book['id']}/{chapter['chapter']}")['verses']
+                conn.executemany(
+                    "INSERT INTO bible VALUES (?, ?, ?, ?, ?)",
+                    [(translation, v['book_id'], v['chapter'], v['verse'], v['text']) for v in verses],
+                )
+            conn.commit()
+            print(f"{translation}: {book['name']} ({len(chapters)} chapters)")
+    conn.execute("VACUUM")
+    conn.close()
+    os.replace(tmp_path, path)
+
+if __name__ == "__main__":
+    build(sys.argv[1] if len(sys.argv) > 1 else 'bible.db')
@@ -6,14 +6,383 @@ A comprehensive Bible server providing verse lookup, search, chapter reading, an
 This MCP server is configured for remote hosting with SSE transport.
 """
 
+import asyncio
+import contextlib
+import functools
+import itertools
+import logging
 import os
+import random
+import re
+import socket
+import sqlite3
+import sys
+import urllib.parse
+
+import aiohttp
+import orjson
+import redis.asyncio as redis
+import zstandard as zstd
+from async_lru import alru_cache
 from fastmcp import FastMCP
+from starlette.applications import Starlette
+from starlette.routing import Mount
+
+logger = logging.getLogger(__name__)
 
 # Initialize the MCP server
 mcp = FastMCP("Bible MCP Server")
 
+# Optional Redis cache shared across replicas and restarts, enabled by REDIS_URL
+REDIS_URL = os.environ.get("REDIS_URL")
+REDIS_TTL = 86400 * 30
+# Short socket timeouts turn a stalled or blackholed Redis into a RedisError, so
+# lookups fall back to HTTP instead of hanging
+_redis: redis.Redis | None = (
+    redis.Redis.from_pool(redis.ConnectionPool.from_url(
+        REDIS_URL, max_connections=50, socket_connect_timeout=0.5, socket_timeout=0.5,
+    ))
+    if REDIS_URL else None
+)
+
+# Cached bodies are zstd-compressed; Bible JSON shrinks roughly 3-4x at level 3
+_zstd_c = zstd.ZstdCompressor(level=3)
+_zstd_d = zstd.ZstdDecompressor()
+
+# Most references get_verses accepts per call; bible-api.com allows 15 requests per 30s
+MAX_BATCH_REFERENCES = 10
+
+# Verses get_random_verse chooses from, prefetched for the default translation on startup
+INSPIRING_VERSES = (
+    'Jeremiah 29:11', 'Romans 8:28', 'Philippians 4:13', 'John 3:16',
+    'Psalm 23:1', 'Isaiah 40:31', 'Proverbs 3:5-6', 'Matthew 28:20',
+    'Romans 8:31', 'Ephesians 2:8-9', 'Psalm 46:1', 'Isaiah 41:10'
+)
+
+# Random index into INSPIRING_VERSES (and each translation's prebuilt responses)
+_pick = functools.partial(random.randrange, len(INSPIRING_VERSES))
+
+# All 66 books with their abbreviations, and the translations bible-api.com serves
+BIBLE_BOOKS = (
+    'Genesis (Gen)', 'Exodus (Exo)', 'Leviticus (Lev)', 'Numbers (Num)', 'Deuteronomy (Deu)',
+    'Joshua (Jos)', 'Judges (Jdg)', 'Ruth (Rut)', '1 Samuel (1Sa)', '2 Samuel (2Sa)',
+    '1 Kings (1Ki)', '2 Kings (2Ki)', '1 Chronicles (1Ch)', '2 Chronicles (2Ch)', 'Ezra (Ezr)',
+    'Nehemiah (Neh)', 'Esther (Est)', 'Job (Job)', 'Psalms (Psa)', 'Proverbs (Pro)',
+    'Ecclesiastes (Ecc)', 'Song of Solomon (Son)', 'Isaiah (Isa)', 'Jeremiah (Jer)', 'Lamentations (Lam)',
+    'Ezekiel (Eze)', 'Daniel (Dan)', 'Hosea (Hos)', 'Joel (Joe)', 'Amos (Amo)',
+    'Obadiah (Oba)', 'Jonah (Jon)', 'Micah (Mic)', 'Nahum (Nah)', 'Habakkuk (Hab)',
+    'Zephaniah (Zep)', 'Haggai (Hag)', 'Zechariah (Zec)', 'Malachi (Mal)',
+    'Matthew (Mat)', 'Mark (Mar)', 'Luke (Luk)', 'John (Joh)', 'Acts (Act)',
+    'Romans (Rom)', '1 Corinthians (1Co)', '2 Corinthians (2Co)', 'Galatians (Gal)', 'Ephesians (Eph)',
+    'Philippians (Phi)', 'Colossians (Col)', '1 Thessalonians (1Th)', '2 Thessalonians (2Th)', '1 Timothy (1Ti)',
+    '2 Timothy (2Ti)', 'Titus (Tit)', 'Philemon (Phm)', 'Hebrews (Heb)', 'James (Jam)',
+    '1 Peter (1Pe)', '2 Peter (2Pe)', '1 John (1Jo)', '2 John (2Jo)', '3 John (3Jo)',
+    'Jude (Jud)', 'Revelation (Rev)'
+)
+
+TRANSLATIONS = {
+    'KJV': 'King James Version (1769)',
+    'ASV': 'American Standard Version (1901)',
+    'BBE': 'Bible in Basic English (1965)',
+    'WEB': 'World English Bible',
+    'YLT': 'Youngs Literal Translation (1898)',
+    'DARBY': 'Darby Translation (1890)'
+}
+
+# USFM book ids used by bible-api.com, in the same order as BIBLE_BOOKS
+BOOK_IDS = (
+    'GEN', 'EXO', 'LEV', 'NUM', 'DEU', 'JOS', 'JDG', 'RUT', '1SA', '2SA',
+    '1KI', '2KI', '1CH', '2CH', 'EZR', 'NEH', 'EST', 'JOB', 'PSA', 'PRO',
+    'ECC', 'SNG', 'ISA', 'JER', 'LAM', 'EZK', 'DAN', 'HOS', 'JOL', 'AMO',
+    'OBA', 'JON', 'MIC', 'NAM', 'HAB', 'ZEP', 'HAG', 'ZEC', 'MAL',
+    'MAT', 'MRK', 'LUK', 'JHN', 'ACT', 'ROM', '1CO', '2CO', 'GAL', 'EPH',
+    'PHP', 'COL', '1TH', '2TH', '1TI', '2TI', 'TIT', 'PHM', 'HEB', 'JAS',
+    '1PE', '2PE', '1JN', '2JN', '3JN', 'JUD', 'REV'
+)
+
+# SBL Handbook abbreviations and other common short forms, by USFM id. Ambiguous
+# forms like 'Ez' (Ezra/Ezekiel) and 'Hb' (Habakkuk/Hebrews) are left out on purpose.
+_SHORT_FORMS = {
+    'GEN': ('Gn', 'Ge'), 'EXO': ('Exod', 'Ex'), 'LEV': ('Lv', 'Le'), 'NUM': ('Nm', 'Nu'),
+    'DEU': ('Deut', 'Dt'), 'JOS': ('Josh', 'Jsh'), 'JDG': ('Judg', 'Jg'), 'RUT': ('Rt', 'Ru'),
+    '1SA': ('1 Sam', '1 Sm', '1 S'), '2SA': ('2 Sam', '2 Sm', '2 S'),
+    '1KI': ('1 Kgs', '1 Kg', '1 Kin'), '2KI': ('2 Kgs', '2 Kg', '2 Kin'),
+    '1CH': ('1 Chr', '1 Chron'), '2CH': ('2 Chr', '2 Chron'), 'EZR': ('Ezr',),
+    'NEH': ('Ne',), 'EST': ('Esth', 'Es'), 'JOB': ('Jb',),
+    'PSA': ('Psalm', 'Ps', 'Pss', 'Psm'), 'PRO': ('Prov', 'Prv', 'Pr'),
+    'ECC': ('Eccl', 'Eccles', 'Ec', 'Qoh'), 'SNG': ('Song', 'Cant', 'SS'),
+    'ISA': ('Is',), 'JER': ('Jr',), 'LAM': ('La',), 'EZK': ('Ezek', 'Ezk'),
+    'DAN': ('Dn', 'Da'), 'HOS': ('Ho',), 'JOL': ('Jl',), 'AMO': ('Am',),
+    'OBA': ('Obad', 'Ob'), 'JON': ('Jnh',), 'MIC': ('Mi',), 'NAM': ('Na',),
+    'HAB': ('Hab',), 'ZEP': ('Zeph', 'Zp'), 'HAG': ('Hg',), 'ZEC': ('Zech', 'Zc'),
+    'MAL': ('Ml',), 'MAT': ('Matt', 'Mt'), 'MRK': ('Mk', 'Mr'), 'LUK': ('Lk',),
+    'JHN': ('Jn', 'Jhn'), 'ACT': ('Ac',), 'ROM': ('Rm', 'Ro'),
+    '1CO': ('1 Cor',), '2CO': ('2 Cor',), 'GAL': ('Ga',), 'EPH': ('Ephes',),
+    'PHP': ('Phil', 'Pp'), 'COL': ('Cl',), '1TH': ('1 Thess', '1 Thes'),
+    '2TH': ('2 Thess', '2 Thes'), '1TI': ('1 Tim', '1 Tm'), '2TI': ('2 Tim', '2 Tm'),
+    'TIT': ('Ti',), 'PHM': ('Phlm', 'Philem'), 'HEB': ('Hebr',), 'JAS': ('Jas', 'Jm'),
+    '1PE': ('1 Pet', '1 Pt'), '2PE': ('2 Pet', '2 Pt'), '1JN': ('1 Jn', '1 Jhn'),
+    '2JN': ('2 Jn', '2 Jhn'), '3JN': ('3 Jn', '3 Jhn'), 'JUD': ('Jd',),
+    'REV': ('Rv', 'Re', 'Revelations'),
+}
+
+def _book_aliases() -> dict[str, tuple[str, str]]:
+    """Map lowercase, space-free book names, abbreviations, ids and short forms
+    to (id, name)"""
+    aliases = {}
+    for book, book_id in zip(BIBLE_BOOKS, BOOK_IDS):
+        name, abbr = book[:-1].split(' (')
+        for alias in (name, abbr, book_id, *_SHORT_FORMS[book_id]):
+            aliases[alias.replace(' ', '').lower()] = (book_id, name)
+    return aliases
+
+_BOOK_ALIASES = _book_aliases()
+
+# Book spellings worth sending to bible-api.com
+_VALID_BOOKS = frozenset(_BOOK_ALIASES)
+
+# Book, chapter and optional verse range, e.g. 'Genesis 1', '1 John 4:8', 'Proverbs 3:5-6'
+_REF_RE = re.compile(r'^\s*([1-3]?\s*[A-Za-z]+)\s+(\d+)(?::(\d+)(?:-(\d+))?)?\s*$')
+
+# Anything that can't appear in a translation code (e.g. 'kjv', 'oeb-us')
+_TRANS_RE = re.compile(r'[^a-z-]')
+
+# Optional local mirror of public-domain translations, built by build_bible_db.py
+BIBLE_DB = os.environ.get("BIBLE_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), "bible.db"))
+
+def _open_db(path: str) -> sqlite3.Connection | None:
+    """Open the local Bible database read-only, or return None if it hasn't been built"""
+    if not os.path.exists(path):
+        return None
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+    conn.execute("PRAGMA mmap_size=268435456")
+    return conn
+
+_db = _open_db(BIBLE_DB)
+_db_translations: dict[str, str] = dict(_db.execute("SELECT id, name FROM translations")) if _db else {}
+
+# Percent-encodes a whole path segment or query value, including '/', '+' and '&'
+_quote = functools.partial(urllib.parse.quote, safe='')
+
+# Static resource bodies, rendered once at import
+_BOOKS_STR = f"Bible Books ({len(BIBLE_BOOKS)} total):\n\n" + "\n".join(f"{i+1:2d}. {book}" for i, book in enumerate(BIBLE_BOOKS))
+_TRANSLATIONS_STR = "Available Bible Translations:\n\n" + "\n".join(f"{code}: {name}" for code, name in TRANSLATIONS.items()) + "\n\nNote: Use the code (e.g., 'KJV') when specifying translation in tools."
+
+# Shared HTTP session for bible-api.com, created lazily inside the event loop
+_session: aiohttp.ClientSession | None = None
+_session_lock = asyncio.Lock()
+
+async def _get_session() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session, creating it on first use"""
+    global _session
+    async with _session_lock:
+        if _session is None or _session.closed:
+            _session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=10),
+                # Pooled keep-alive connections so bursts reuse one TLS session, with
+                # non-blocking DNS cached for an hour and IPv4 only to skip happy eyeballs
+                connector=aiohttp.TCPConnector(
+                    limit=100, limit_per_host=10, keepalive_timeout=60,
+                    resolver=aiohttp.AsyncResolver(), use_dns_cache=True, ttl_dns_cache=3600,
+                    family=socket.AF_INET,
+                ),
+            )
+        return _session
+
+async def _close_session() -> None:
+    """Close the shared aiohttp session if one was opened"""
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
+
+async def _cache_get(key: str) -> bytes | None:
+    """Read a raw response body from Redis, treating any Redis failure as a miss"""
+    if _redis is None:
+        return None
+    try:
+        blob = await _redis.get(key)
+    except redis.RedisError as e:
+        logger.warning("Redis read failed for %s: %s", key, e)
+        return None
+    if blob is None:
+        return None
+    try:
+        return _zstd_d.decompress(blob)
+    except zstd.ZstdError:
+        # Written uncompressed by an older server; refetched and overwritten
+        return None
+
+async def _cache_set(key: str, body: bytes) -> None:
+    """Store a raw response body in Redis, ignoring any Redis failure"""
+    if _redis is None:
+        return
+    try:
+        await _redis.set(key, _zstd_c.compress(body), ex=REDIS_TTL)
+    except redis.RedisError as e:
+        logger.warning("Redis write failed for %s: %s", key, e)
+
+async def _close_redis() -> None:
+    """Close the Redis connection pool if Redis caching is enabled"""
+    if _redis is not None:
+        await _redis.aclose()
+
+async def _fetch(reference: str, translation: str) -> dict:
+    """Fetch a passage, normalizing the reference and translation first so that
+    variant spellings like 'jhn  3:16 ' and 'KJV' share cache entries
+
+    Bundled translations are served straight from the local database, which is
+    already fast, so they bypass the in-process LRU.
+
+    Raises:
+        aiohttp.ClientResponseError: If bible-api.com responds with an HTTP error
+    """
+    reference, translation = _normalize(reference, translation)
+    data = _lookup_local(reference, translation)
+    if data is not None:
+        return data
+    return await _fetch_remote(reference, translation)
+
+def _normalize(reference: str, translation: str) -> tuple[str, str]:
+    """Canonicalize a reference and translation code, e.g. ' jhn 3:16' -> 'John 3:16'
+
+    References the parser doesn't recognize only have their whitespace collapsed.
+    """
+    reference = " ".join(reference.split())
+    match = _REF_RE.match(reference)
+    if match is not None:
+        book, chapter, start, end = match.groups()
+        entry = _BOOK_ALIASES.get(book.replace(' ', '').lower())
+        if entry is not None:
+            reference = f"{entry[1]} {int(chapter)}"
+            if start is not None:
+                reference += f":{int(start)}" + (f"-{int(end)}" if end is not None else "")
+    return reference, _TRANS_RE.sub('', translation.lower())
+
+def _unknown_book(reference: str) -> str | None:
+    """Return the book named by a reference if it isn't a known Bible book
+
+    References the parser doesn't recognize are left for bible-api.com to judge.
+    """
+    match = _REF_RE.match(reference)
+    if match is None or match.group(1).replace(' ', '').lower() in _VALID_BOOKS:
+        return None
+    return " ".join(match.group(1).split())
+
+def _lookup_local(reference: str, translation: str) -> dict | None:
+    """Serve a passage from the local database in bible-api.com's response shape
+
+    Returns None when the translation isn't bundled or the reference can't be
+    resolved locally, so the caller can fall back to bible-api.com.
+    """
+    if translation not in _db_translations:
+        return None
+    match = _REF_RE.match(reference)
+    if match is None:
+        return None
+    book, chapter, start, end = match.groups()
+    entry = _BOOK_ALIASES.get(book.replace(' ', '').lower())
+    if entry is None:
+        return None
+    book_id, book_name = entry
+    if start is None:
+        rows = _db.execute(
+            "SELECT verse, text FROM bible WHERE translation=? AND book=? AND chapter=? ORDER BY verse",
+            (translation, book_id, int(chapter)),
+        ).fetchall()
+        ref = f"{book_name} {chapter}"
+    else:
+        last = int(end or start)
+        rows = _db.execute(
+            "SELECT verse, text FROM bible WHERE translation=? AND book=? AND chapter=? AND verse BETWEEN ? AND ? ORDER BY verse",
+            (translation, book_id, int(chapter), int(start), last),
+        ).fetchall()
+        if len(rows) != last - int(start) + 1:
+            return None
+        ref = f"{book_name} {chapter}:{start}" + (f"-{end}" if end else "")
+    if not rows:
+        return None
+    return {
+        'reference': ref,
+        'verses': [
+            {'book_id': book_id, 'book_name': book_name, 'chapter': int(chapter), 'verse': verse, 'text': text}
+            for verse, text in rows
+        ],
+        'text': "".join(text for _, text in rows),
+        'translation_id': translation,
+        'translation_name': _db_translations[translation],
+    }
+
+# Entries are parsed responses: roughly 2KB per verse, 16KB for a typical
+# 25-verse chapter and 100KB for Psalm 119. 512 entries keeps a chapter-heavy
+# cache to about 20MB per worker process.
+@alru_cache(maxsize=512)
+async def _fetch_remote(reference: str, translation: str) -> dict:
+    """Fetch a normalized passage from bible-api.com, memoized since Bible text
+    never changes and read through the Redis cache when one is configured
+
+    Raises:
+        aiohttp.ClientResponseError: If bible-api.com responds with an HTTP error
+    """
+    key = f"bible:{translation}:{reference}"
+    body = await _cache_get(key)
+    if body is None:
+        url = f'https://bible-api.com/{_quote(reference)}?translation={_quote(translation)}'
+        session = await _get_session()
+        async with session.get(url, raise_for_status=True) as response:
+            body = await response.read()
+        await _cache_set(key, body)
+    return orjson.loads(body)
+
+# Formatted get_random_verse responses fetched so far, per translation code and
+# verse index, frozen into _RANDOM_CACHE once every inspiring verse is present
+_random_fetched: dict[str, dict[int, str]] = {}
+_RANDOM_CACHE: dict[str, tuple[str, ...]] = {}
+
+async def _random_verse(translation: str, index: int) -> str:
+    """Fetch and format one inspiring verse, recording it so the translation's
+    table fills in one verse at a time as it is requested
+
+    Raises:
+        aiohttp.ClientResponseError: If bible-api.com responds with an HTTP error
+    """
+    data = await _fetch(INSPIRING_VERSES[index], translation)
+    text = f"Random Verse - {data['reference']} ({data['translation_name']}):\n{data['text'].strip()}"
+    fetched = _random_fetched.setdefault(translation, {})
+    fetched[index] = text
+    if len(fetched) == len(INSPIRING_VERSES):
+        _RANDOM_CACHE[translation] = tuple(fetched[i] for i in range(len(INSPIRING_VERSES)))
+        del _random_fetched[translation]
+    return text
+
+async def _claim_warmup() -> bool:
+    """Claim the startup warmup through Redis, so that replicas and workers booting
+    together warm the shared cache once an hour between them"""
+    if _redis is None:
+        return True
+    try:
+        return bool(await _redis.set("bible:warmup", b"1", nx=True, ex=3600))
+    except redis.RedisError as e:
+        logger.warning("Redis warmup claim failed, skipping warmup: %s", e)
+        return False
+
+async def _warmup() -> None:
+    """Prefetch the inspiring verses and their get_random_verse responses"""
+    if not await _claim_warmup():
+        return
+    results = await asyncio.gather(
+        *[_random_verse('kjv', i) for i in range(len(INSPIRING_VERSES))], return_exceptions=True
+    )
+    for ref, result in zip(INSPIRING_VERSES, results):
+        if isinstance(result, asyncio.CancelledError):
+            raise result
+        if isinstance(result, (aiohttp.ClientError, asyncio.TimeoutError)):
+            logger.warning("Cache warmup failed for %s: %r", ref, result)
+        elif isinstance(result, BaseException):
+            logger.error("Cache warmup failed unexpectedly for %s", ref, exc_info=result)
+
 @mcp.tool()
-def get_verse(reference: str, translation: str) -> str:
+async def get_verse(reference: str, translation: str) -> str:
     """Look up specific Bible verses by reference (e.g., 'John 3:16', 'Romans 8:28')
 
     Args:
@@ -23,20 +392,58 @@ def get_verse(reference: str, translation: str) -> str:
     Returns:
         The requested Bible verse(s) with reference and text
     """
-    import requests
+    book = _unknown_book(reference)
+    if book is not None:
+        return f"Error: Unknown book '{book}'. See bible://books."
     translation = translation or 'kjv'
-    url = f'https://bible-api.com/{reference}?translation={translation}'
-    response = requests.get(url)
-    if response.status_code == 200:
-        data = response.json()
-        if 'error' in data:
-            return f"Error: {data['error']}"
-        return f"{data['reference']} ({data['translation_name']}):\n{data['text'].strip()}"
-    else:
-        return f"Error fetching verse: HTTP {response.status_code}"
+    try:
+        data = await _fetch(reference, translation)
+    except aiohttp.ClientResponseError as e:
+        return f"Error fetching verse: HTTP {e.status}"
+    if 'error' in data:
+        return f"Error: {data['error']}"
+    return f"{data['reference']} ({data['translation_name']}):\n{data['text'].strip()}"
 
 @mcp.tool()
-def search_verses(query: str, limit: int) -> str:
+async def get_verses(references: list[str], translation: str) -> str:
+    """Look up several Bible verses at once (e.g., ['John 3:16', 'Romans 8:28'])
+
+    Args:
+        references: List of Bible verse references to look up
+        translation: Bible translation (default: KJV)
+
+    Returns:
+        Each requested verse with reference and text, in the order requested
+    """
+    if not references:
+        return "Error: No references provided"
+    if len(references) > MAX_BATCH_REFERENCES:
+        return f"Error: At most {MAX_BATCH_REFERENCES} references can be looked up at once"
+    translation = translation or 'kjv'
+    unknown = {i: book for i, ref in enumerate(references) if (book := _unknown_book(ref)) is not None}
+    pending = [i for i in range(len(references)) if i not in unknown]
+    fetched = await asyncio.gather(*[_fetch(references[i], translation) for i in pending], return_exceptions=True)
+    results = dict(zip(pending, fetched))
+    passages = []
+    for i, reference in enumerate(references):
+        if i in unknown:
+            passages.append(f"Error: Unknown book '{unknown[i]}'. See bible://books.")
+            continue
+        data = results[i]
+        if isinstance(data, aiohttp.ClientResponseError):
+            passages.append(f"Error fetching {reference}: HTTP {data.status}")
+        elif isinstance(data, (aiohttp.ClientError, asyncio.TimeoutError)):
+            passages.append(f"Error fetching {reference}: request failed")
+        elif isinstance(data, BaseException):
+            raise data
+        elif 'error' in data:
+            passages.append(f"Error fetching {reference}: {data['error']}")
+        else:
+            passages.append(f"{data['reference']} ({data['translation_name']}):\n{data['text'].strip()}")
+    return "\n\n".join(passages)
+
+@mcp.tool()
+async def search_verses(query: str, limit: int) -> str:
     """Search for Bible verses containing specific words or phrases
 
     Args:
@@ -46,23 +453,23 @@ def search_verses(query: str, limit: int) -> str:
     Returns:
         List of Bible verses containing the search term
     """
-    import requests
     limit = limit or 10
-    url = f'https://bible-api.com/search/{query}?limit={limit}'
-    response = requests.get(url)
-    if response.status_code == 200:
-        data = response.json()
-        if not data or len(data) == 0:
-            return f"No verses found containing '{query}'"
-        results = []
-        for verse in data[:limit]:
-            results.append(f"{verse['reference']}: {verse['text'].strip()}")
-        return f"Found {len(results)} verse(s) for '{query}':\n\n" + "\n\n".join(results)
-    else:
-        return f"Error searching verses: HTTP {response.status_code}"
+    if limit < 1:
+        return "Error: limit must be a positive number"
+    url = f'https://bible-api.com/search/{_quote(query)}?limit={limit}'
+    session = await _get_session()
+    async with session.get(url) as response:
+        if response.status == 200:
+            data = orjson.loads(await response.read())
+            if not data or len(data) == 0:
+                return f"No verses found containing '{query}'"
+            results = [f"{verse['reference']}: {verse['text'].strip()}" for verse in itertools.islice(data, limit)]
+            return f"Found {len(results)} verse(s) for '{query}':\n\n" + "\n\n".join(results)
+        else:
+            return f"Error searching verses: HTTP {response.status}"
 
 @mcp.tool()
-def get_chapter(book_chapter: str, translation: str) -> str:
+async def get_chapter(book_chapter: str, translation: str) -> str:
     """Get an entire Bible chapter
 
     Args:
@@ -72,23 +479,23 @@ def get_chapter(book_chapter: str, translation: str) -> str:
     Returns:
         The complete chapter text with all verses
     """
-    import requests
+    book = _unknown_book(book_chapter)
+    if book is not None:
+        return f"Error: Unknown book '{book}'. See bible://books."
     translation = translation or 'kjv'
-    url = f'https://bible-api.com/{book_chapter}?translation={translation}'
-    response = requests.get(url)
-    if response.status_code == 200:
-        data = response.json()
-        if 'error' in data:
-            return f"Error: {data['error']}"
-        chapter_text = f"{data['reference']} ({data['translation_name']}):\n\n"
-        for verse in data['verses']:
-            chapter_text += f"{verse['verse']}. {verse['text']}\n"
-        return chapter_text.strip()
-    else:
-        return f"Error fetching chapter: HTTP {response.status_code}"
+    try:
+        data = await _fetch(book_chapter, translation)
+    except aiohttp.ClientResponseError as e:
+        return f"Error fetching chapter: HTTP {e.status}"
+    if 'error' in data:
+        return f"Error: {data['error']}"
+    parts = [f"{data['reference']} ({data['translation_name']}):", ""]
+    parts.extend(f"{verse['verse']}. {verse['text']}" for verse in data['verses'])
+    # Verse texts end in a newline, so only the tail of the joined chapter needs trimming
+    return "\n".join(parts).rstrip()
 
 @mcp.tool()
-def get_random_verse(translation: str) -> str:
+async def get_random_verse(translation: str) -> str:
     """Get a random inspiring Bible verse
 
     Args:
@@ -97,56 +504,25 @@ def get_random_verse(translation: str) -> str:
     Returns:
         A random Bible verse for inspiration
     """
-    import requests
-    import random
-    inspiring_verses = [
-        'Jeremiah 29:11', 'Romans 8:28', 'Philippians 4:13', 'John 3:16',
-        'Psalm 23:1', 'Isaiah 40:31', 'Proverbs 3:5-6', 'Matthew 28:20',
-        'Romans 8:31', 'Ephesians 2:8-9', 'Psalm 46:1', 'Isaiah 41:10'
-    ]
-    verse_ref = random.choice(inspiring_verses)
-    translation = translation or 'kjv'
-    url = f'https://bible-api.com/{verse_ref}?translation={translation}'
-    response = requests.get(url)
-    if response.status_code == 200:
-        data = response.json()
-        return f"Random Verse - {data['reference']} ({data['translation_name']}):\n{data['text'].strip()}"
-    else:
-        return f"Error fetching random verse: HTTP {response.status_code}"
+    translation = _TRANS_RE.sub('', (translation or 'kjv').lower())
+    index = _pick()
+    table = _RANDOM_CACHE.get(translation)
+    if table is not None:
+        return table[index]
+    try:
+        return await _random_verse(translation, index)
+    except aiohttp.ClientResponseError as e:
+        return f"Error fetching random verse: HTTP {e.status}"
 
 @mcp.resource("bible://books")
 def bible_books() -> str:
     """List of all 66 books of the Bible with their abbreviations"""
-    books = [
-        'Genesis (Gen)', 'Exodus (Exo)', 'Leviticus (Lev)', 'Numbers (Num)', 'Deuteronomy (Deu)',
-        'Joshua (Jos)', 'Judges (Jdg)', 'Ruth (Rut)', '1 Samuel (1Sa)', '2 Samuel (2Sa)',
-        '1 Kings (1Ki)', '2 Kings (2Ki)', '1 Chronicles (1Ch)', '2 Chronicles (2Ch)', 'Ezra (Ezr)',
-        'Nehemiah (Neh)', 'Esther (Est)', 'Job (Job)', 'Psalms (Psa)', 'Proverbs (Pro)',
-        'Ecclesiastes (Ecc)', 'Song of Solomon (Son)', 'Isaiah (Isa)', 'Jeremiah (Jer)', 'Lamentations (Lam)',
-        'Ezekiel (Eze)', 'Daniel (Dan)', 'Hosea (Hos)', 'Joel (Joe)', 'Amos (Amo)',
-        'Obadiah (Oba)', 'Jonah (Jon)', 'Micah (Mic)', 'Nahum (Nah)', 'Habakkuk (Hab)',
-        'Zephaniah (Zep)', 'Haggai (Hag)', 'Zechariah (Zec)', 'Malachi (Mal)',
-        'Matthew (Mat)', 'Mark (Mar)', 'Luke (Luk)', 'John (Joh)', 'Acts (Act)',
-        'Romans (Rom)', '1 Corinthians (1Co)', '2 Corinthians (2Co)', 'Galatians (Gal)', 'Ephesians (Eph)',
-        'Philippians (Phi)', 'Colossians (Col)', '1 Thessalonians (1Th)', '2 Thessalonians (2Th)', '1 Timothy (1Ti)',
-        '2 Timothy (2Ti)', 'Titus (Tit)', 'Philemon (Phm)', 'Hebrews (Heb)', 'James (Jam)',
-        '1 Peter (1Pe)', '2 Peter (2Pe)', '1 John (1Jo)', '2 John (2Jo)', '3 John (3Jo)',
-        'Jude (Jud)', 'Revelation (Rev)'
-    ]
-    return f"Bible Books ({len(books)} total):\n\n" + "\n".join([f"{i+1:2d}. {book}" for i, book in enumerate(books)])
+    return _BOOKS_STR
 
 @mcp.resource("bible://translations")
 def bible_translations() -> str:
     """Available Bible translations and their codes"""
-    translations = {
-        'KJV': 'King James Version (1769)',
-        'ASV': 'American Standard Version (1901)',
-        'BBE': 'Bible in Basic English (1965)',
-        'WEB': 'World English Bible',
-        'YLT': 'Youngs Literal Translation (1898)',
-        'DARBY': 'Darby Translation (1890)'
-    }
-    return "Available Bible Translations:\n\n" + "\n".join([f"{code}: {name}" for code, name in translations.items()]) + "\n\nNote: Use the code (e.g., 'KJV') when specifying translation in tools."
+    return _TRANSLATIONS_STR
 
 @mcp.prompt()
 def bible_study(topic_or_passage: str, study_level: str) -> str:
@@ -195,8 +571,60 @@ Create a meaningful daily devotional that includes:
 
 Write this in a warm, encouraging tone that speaks to both heart and mind. Make it practical for someone's daily walk with God."""
 
+@contextlib.asynccontextmanager
+async def _lifespan(warm: bool = True):
+    """Optionally warm the caches in the background, closing the shared HTTP and
+    Redis clients on shutdown"""
+    warmup = asyncio.create_task(_warmup()) if warm else None
+    try:
+        yield
+    finally:
+        if warmup is not None:
+            warmup.cancel()
+        await _close_session()
+        await _close_redis()
+
+def create_app() -> Starlette:
+    """ASGI app for running several worker processes under gunicorn
+
+    SSE sessions live in the process that opened them, so workers serve
+    stateless Streamable HTTP at /mcp instead; Redis shares the cache between them.
+    Workers only warm up through Redis, where a single worker claims the warmup;
+    without it every worker would fire its own burst at bible-api.com.
+    """
+    mcp_app = mcp.http_app(transport="streamable-http", stateless_http=True)
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app: Starlette):
+        async with mcp_app.lifespan(app), _lifespan(warm=_redis is not None):
+            yield
+
+    return Starlette(routes=[Mount("/", app=mcp_app)], lifespan=lifespan)
+
+async def main(port: int) -> None:
+    """Serve over SSE in a single process"""
+    async with _lifespan():
+        await mcp.run_async(transport="sse", host="0.0.0.0", port=port)
+
 if __name__ == "__main__":
     # Run with SSE transport for remote hosting
     # Railway will set the PORT environment variable
     port = int(os.environ.get("PORT", 8000))
-    mcp.run(transport="sse", host="0.0.0.0", port=port)
+    workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+    if workers > 1 and sys.platform == "win32":
+        logger.warning("WEB_CONCURRENCY=%d ignored: gunicorn isn't available on Windows, serving SSE in one process", workers)
+        workers = 1
+    if workers > 1:
+        # One Uvicorn worker process per core, all serving create_app()
+        os.execvp("gunicorn", [
+            "gunicorn", "server:create_app()",
+            "-k", "uvicorn_worker.UvicornWorker",
+            "-w", str(workers),
+            "-b", f"0.0.0.0:{port}",
+        ])
+    elif sys.platform == "win32":
+        asyncio.run(main(port))
+    else:
+        # libuv-based event loop for faster SSE and HTTP client scheduling
+        import uvloop
+        uvloop.run(main(port))
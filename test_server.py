@@ -0,0 +1,50 @@
+"""
+Tests for the Bible MCP Server book-name handling
+"""
+
+import pytest
+
+import server
+
+@pytest.mark.parametrize("reference, expected", [
+    ('Genesis 1:1', 'Genesis 1:1'),
+    ('Gn 1:1', 'Genesis 1:1'),
+    ('Lv 19:18', 'Leviticus 19:18'),
+    ('Dt 6:4', 'Deuteronomy 6:4'),
+    ('1 Kgs 19:12', '1 Kings 19:12'),
+    ('Psalm 23', 'Psalms 23'),
+    ('Ps 23:1', 'Psalms 23:1'),
+    ('Matt 5:3', 'Matthew 5:3'),
+    ('Mr 1:1', 'Mark 1:1'),
+    ('Jn 3:16', 'John 3:16'),
+    ('jhn  3:16 ', 'John 3:16'),
+    ('1john 4:8', '1 John 4:8'),
+    ('Phil 4:13', 'Philippians 4:13'),
+    ('Phlm 1:6', 'Philemon 1:6'),
+    ('Jude 1:3', 'Jude 1:3'),
+    ('Rv 21:4', 'Revelation 21:4'),
+    ('Proverbs 3:5-6', 'Proverbs 3:5-6'),
+])
+def test_known_books_are_accepted_and_canonicalized(reference, expected):
+    assert server._unknown_book(reference) is None
+    assert server._normalize(reference, 'KJV') == (expected, 'kjv')
+
+@pytest.mark.parametrize("reference, book", [
+    ('Genisis 1', 'Genisis'),
+    ('Exodos 3:14', 'Exodos'),
+    ('Ju 1:1', 'Ju'),
+    ('Ez 1:1', 'Ez'),
+])
+def test_unknown_books_are_rejected(reference, book):
+    assert server._unknown_book(reference) == book
+
+def test_unparseable_references_are_left_to_bible_api():
+    assert server._unknown_book('Song of Solomon 2:1') is None
+
+def test_aliases_are_unambiguous():
+    seen = {}
+    for book, book_id in zip(server.BIBLE_BOOKS, server.BOOK_IDS):
+        name, abbr = book[:-1].split(' (')
+        for alias in (name, abbr, book_id, *server._SHORT_FORMS[book_id]):
+            key = alias.replace(' ', '').lower()
+            assert seen.setdefault(key, book_id) == book_id, key